@@ -502,7 +502,9 @@ class MO2Instance(ModInstance):
                             show2=True,
                             text2=f"Processed {files_processed}/{file_count} files ({file_percent}%)",
                             show3=True,
-                            text3=f"{task['mod_name']} - {task['file_name']}"
+                            text3=f"{task['mod_name']} - {task['file_name']}",
+                            completed=files_processed,
+                            total=file_count,
                         )
                 return True
             except OSError as e:
@@ -407,6 +407,8 @@ Vortex is running!"
                         max2=len(mod.files),
                         show3=True,
                         text3=f"{file.name} ({utils.scale_value(os.path.getsize(src_path))})",
+                        completed=fileindex,
+                        total=len(mod.files),
                     )
 
                 # Create directory structure and hardlink file
@@ -32,7 +32,7 @@ class LoadingDialog(qtw.QDialog):
 
     start_signal = qtc.Signal()
     stop_signal = qtc.Signal()
-    progress_signal = qtc.Signal(dict)
+    progress_signal = qtc.Signal(object)  # object avoids converting the dict
 
     def __init__(self, parent: qtw.QWidget, app: main.MainApp, func: Callable):
         super().__init__(parent)
@@ -49,21 +49,31 @@ class LoadingDialog(qtw.QDialog):
         
         # Operation tracking
         self.last_operations = deque(maxlen=5)  # Store the last 5 operations
+        self._ops_set: set[str] = set()  # Same operations for fast lookups
         self.total_operations = 0
         self.completed_operations = 0
         self.current_size_processed = 0
         self.total_size = 0
-        self.start_time = None
+        self._t0: float | None = None  # Monotonic start time of the operation
+
+        # Cache for size label
+        self._last_max1: int | None = None
+        self._last_scaled_max = ""
+        self._last_value_bucket = -1
+
+        # Latest progress waiting to be applied by the UI thread
+        self._pending_progress: dict | None = None
+        self._progress_lock = threading.Lock()
+        self._last_sent: tuple | None = None  # Last update passed by the worker(s)
         
-        self.func = lambda: (
-            self.start_signal.emit(),
-            func(self),
-            self.stop_signal.emit(),
-        )
+        self._user_func = func
         self.dialog_thread = LoadingDialogThread(
-            dialog=self, target=self.func, daemon=True, name="BackgroundThread"
+            dialog=self, target=self._run, daemon=True, name="BackgroundThread"
         )
-        self.starttime = None
+
+        # Last displayed elapsed second and cached window title prefix
+        self._last_title_secs = -1
+        self._title_prefix = ""
 
         # Set up dialog layout
         self.layout = qtw.QVBoxLayout()
@@ -79,11 +89,11 @@ class LoadingDialog(qtw.QDialog):
         self.stats_layout = qtw.QHBoxLayout()
         
         # File counter
-        self.files_label = qtw.QLabel("Files: 0 / 0")
+        self.files_label = qtw.QLabel(f"Files: {0:>6}/{0:<6}")
         self.stats_layout.addWidget(self.files_label)
         
         # Size counter
-        self.size_label = qtw.QLabel("Size: 0 B / 0 B")
+        self.size_label = qtw.QLabel(f"Size: {'0B':>9} / {'0B':<9}")
         self.stats_layout.addWidget(self.size_label)
         
         # Elapsed time
@@ -116,18 +126,31 @@ class LoadingDialog(qtw.QDialog):
         self.current_op_label = qtw.QLabel("Waiting to start...")
         self.operations_layout.addWidget(self.current_op_label)
         
-        # Recent operations list
-        self.recent_ops_list = qtw.QListWidget()
-        self.recent_ops_list.setAlternatingRowColors(True)
-        self.recent_ops_list.setMaximumHeight(120)  # Limit height
-        self.operations_layout.addWidget(self.recent_ops_list)
+        # Recent operations (one fixed label per line)
+        self._op_labels: list[qtw.QLabel] = []
+        for _ in range(self.last_operations.maxlen):
+            op_label = qtw.QLabel("")
+            op_label.setTextFormat(qtc.Qt.TextFormat.PlainText)
+            # Don't let long texts widen the dialog
+            op_label.setSizePolicy(
+                qtw.QSizePolicy.Policy.Ignored, qtw.QSizePolicy.Policy.Preferred
+            )
+            self.operations_layout.addWidget(op_label)
+            self._op_labels.append(op_label)
         
         self.layout.addWidget(self.operations_group)
 
-        # Connect signals
-        self.start_signal.connect(self.on_start)
-        self.stop_signal.connect(self.on_finish)
-        self.progress_signal.connect(self.on_progress)
+        # Connect signals (always queued since they are emitted by the background thread)
+        queued = qtc.Qt.ConnectionType.QueuedConnection
+        self.start_signal.connect(self.on_start, queued)
+        self.stop_signal.connect(self.on_finish, queued)
+        self.progress_signal.connect(self.on_progress, queued)
+
+        # Coalesces progress updates to one UI refresh per interval
+        self._coalesce_timer = qtc.QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(33)
+        self._coalesce_timer.timeout.connect(self._flush_progress)
 
         # Set minimum width and configure dialog
         self.setMinimumWidth(600)
@@ -135,42 +158,80 @@ class LoadingDialog(qtw.QDialog):
         self.setWindowIcon(parent.windowIcon())
         self.setStyleSheet(parent.styleSheet())
         self.setWindowFlag(qtc.Qt.WindowType.WindowCloseButtonHint, False)
+
+        # Reserve space for the widest expected texts to avoid relayouts on updates
+        # (after applying the stylesheet so that the styled font is measured)
+        for label, widest_text in [
+            (self.files_label, "Files: 000000/000000"),
+            (self.size_label, "Size: 0000.00MB / 0000.00MB"),
+            (self.time_label, "Time: 00:00"),
+            (self.speed_label, "Speed: 0000.00 MB/s"),
+        ]:
+            label.setTextFormat(qtc.Qt.TextFormat.PlainText)
+            label.ensurePolished()
+            label.setMinimumWidth(label.fontMetrics().horizontalAdvance(widest_text))
         
         # Start timer for elapsed time updates
         self.timer = qtc.QTimer(self)
+        self.timer.setTimerType(qtc.Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.update_elapsed_time)
-        self.timer.start(500)  # Update twice per second
+        self.timer.start(1000)  # Update once per second
     
     def __repr__(self):
         return "LoadingDialog"
+
+    def showEvent(self, event):
+        """
+        Centers the dialog when it is shown
+        """
+        super().showEvent(event)
+        self.move(self.app.root.frameGeometry().center() - self.rect().center())
     
+    def _run(self):
+        """
+        Runs user function in the background thread
+        and notifies the dialog about start and stop.
+        """
+        self.start_signal.emit()
+        try:
+            self._user_func(self)
+        finally:
+            self.stop_signal.emit()
+
     def update_elapsed_time(self):
         """
         Update the elapsed time display
         """
-        if self.starttime is None:
+        if self._t0 is None:
             return
             
-        elapsed = time.time() - self.starttime
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        elapsed = time.monotonic() - self._t0
+
+        # Skip update if the displayed second has not changed
+        secs = int(elapsed)
+        if secs == self._last_title_secs:
+            return
+        self._last_title_secs = secs
+
+        minutes = secs // 60
+        seconds = secs % 60
         
         # Calculate speed
         if elapsed > 0 and self.current_size_processed > 0:
             speed = self.current_size_processed / elapsed / (1024 * 1024)  # MB/s
-            self.speed_label.setText(f"Speed: {speed:.2f} MB/s")
+            self.speed_label.setText(f"Speed: {speed:>7.2f} MB/s")
         
         self.time_label.setText(f"Time: {minutes:02d}:{seconds:02d}")
         
         # Update window title
-        self.setWindowTitle(f"{self.app.name} - {self.app.loc.main.elapsed}: {minutes:02d}:{seconds:02d}")
+        self.setWindowTitle(f"{self._title_prefix}{minutes:02d}:{seconds:02d}")
         
     def on_start(self):
         """
         Called when the background thread starts
         """
-        self.starttime = time.time()
-        self.start_time = self.starttime
+        self._t0 = time.monotonic()
+        self._title_prefix = f"{self.app.name} - {self.app.loc.main.elapsed}: "
         self.current_op_label.setText("Starting operation...")
         self.main_progress_label.setText("Initializing...")
         
@@ -180,14 +241,18 @@ class LoadingDialog(qtw.QDialog):
         """
         # Stop the timer
         self.timer.stop()
+
+        # Apply progress that is still waiting for the coalesce timer
+        self._coalesce_timer.stop()
+        self._flush_progress()
         
         # Final update of progress
         if self.total_operations > 0:
             self.main_progress_bar.setValue(100)
-            self.files_label.setText(f"Files: {self.completed_operations} / {self.total_operations}")
+            self.files_label.setText(f"Files: {self.completed_operations:>6}/{self.total_operations:<6}")
             
         # Show completion message
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self._t0
         minutes = int(elapsed // 60)
         seconds = int(elapsed % 60)
         
@@ -195,31 +260,44 @@ class LoadingDialog(qtw.QDialog):
         self.current_op_label.setText("All operations completed successfully.")
         
         # Add final status to the list
-        self.recent_ops_list.addItem(f"Completed {self.completed_operations} operations in {minutes:02d}:{seconds:02d}")
-        
+        self.add_operation_to_list(f"Completed {self.completed_operations} operations in {minutes:02d}:{seconds:02d}")
+
         # Close after a short delay
-        qtc.QTimer.singleShot(500, self.accept)
+        qtc.QTimer.singleShot(
+            500, qtc.Qt.TimerType.CoarseTimer, self, qtc.SLOT("accept()")
+        )
     
-    def on_progress(self, progress):
+    @qtc.Slot(object)
+    def on_progress(self, progress: dict):
         """
         Process progress updates from the background thread
         """
         self.setProgress(progress)
+
+    def _flush_progress(self):
+        """
+        Applies the latest pending progress to the UI
+        """
+        with self._progress_lock:
+            progress = self._pending_progress
+            self._pending_progress = None
+
+        if progress is not None:
+            self.setProgress(progress)
         
     def add_operation_to_list(self, operation_text):
         """
         Add an operation to the recent operations list
         """
         # Only keep the last 5 operations to avoid overwhelming the UI
+        if len(self.last_operations) == self.last_operations.maxlen:
+            self._ops_set.discard(self.last_operations[0])
         self.last_operations.append(operation_text)
+        self._ops_set.add(operation_text)
         
-        # Update the list widget
-        self.recent_ops_list.clear()
-        for op in self.last_operations:
-            self.recent_ops_list.addItem(op)
-            
-        # Scroll to the bottom to show the most recent operation
-        self.recent_ops_list.scrollToBottom()
+        # Update the labels; the most recent operation is at the bottom
+        for op_label, op in zip(self._op_labels, self.last_operations):
+            op_label.setText(op)
 
     def updateProgress(
         self,
@@ -234,11 +312,16 @@ class LoadingDialog(qtw.QDialog):
         text3: str = None,
         value3: int = None,
         max3: int = None,
+        completed: int = None,
+        total: int = None,
     ):
         """
         Updates progress of progressbars.
         This method is thread safe for usage with Qt.
 
+        Updates are coalesced and applied to the UI
+        at most once per coalesce interval (33 ms).
+
         Parameters:
             text1: str (text displayed over first progressbar)
             value1: int (progress of first progressbar)
@@ -253,6 +336,9 @@ class LoadingDialog(qtw.QDialog):
             text3: str (text displayed over third progressbar)
             value3: int (progress of third progressbar)
             max3: int (maximum value of third progressbar)
+
+            completed: int (number of completed files)
+            total: int (total number of files)
         """
 
         # Convert parameters to a centralized format for our new UI
@@ -268,9 +354,30 @@ class LoadingDialog(qtw.QDialog):
             "text3": text3,
             "value3": value3,
             "max3": max3,
+            "completed": completed,
+            "total": total,
         }
         
-        self.progress_signal.emit(progress_data)
+        # Merge into pending progress; only the latest values get displayed
+        with self._progress_lock:
+            # Skip update if nothing changed since the last one
+            last_sent = tuple(progress_data.values())
+            if last_sent == self._last_sent:
+                return
+            self._last_sent = last_sent
+
+            schedule = self._pending_progress is None
+            if schedule:
+                self._pending_progress = {}
+            self._pending_progress.update(
+                {key: value for key, value in progress_data.items() if value is not None}
+            )
+
+        # Start coalesce timer in the UI thread
+        if schedule:
+            qtc.QMetaObject.invokeMethod(
+                self._coalesce_timer, "start", qtc.Qt.ConnectionType.QueuedConnection
+            )
 
     def setProgress(self, progress: dict):
         """
@@ -289,6 +396,9 @@ class LoadingDialog(qtw.QDialog):
         max2 = progress.get("max2", None)
         
         text3 = progress.get("text3", None)
+
+        completed = progress.get("completed", None)
+        total = progress.get("total", None)
         
         # For backward compatibility with legacy code
         if text1 is None:
@@ -310,44 +420,57 @@ class LoadingDialog(qtw.QDialog):
                 
                 # Update size information
                 self.current_size_processed = value1
-                self.size_label.setText(f"Size: {utils.scale_value(value1)} / {utils.scale_value(max1)}")
+                if max1 != self._last_max1:
+                    self._last_max1 = max1
+                    self._last_scaled_max = utils.scale_value(max1)
+                    self._last_value_bucket = -1
+
+                # Only update label if value changed by at least 0.1 %
+                bucket = value1 * 1000 // max1
+                if bucket != self._last_value_bucket:
+                    self._last_value_bucket = bucket
+                    self.size_label.setText(
+                        f"Size: {utils.scale_value(value1):>9} / {self._last_scaled_max:<9}"
+                    )
                 
         # Update operation information
         if text1 is not None:
             self.main_progress_label.setText(text1)
             
+        # Update file information if passed explicitly
+        if completed is not None and total is not None:
+            self.completed_operations = completed
+            self.total_operations = total
+            self.files_label.setText(f"Files: {completed:>6}/{total:<6}")
+
         # Update file information if text2 contains file information
         if text2 is not None:
             # Check if text2 contains information about file count
-            if " (" in text2 and ")" in text2:
-                try:
-                    # Extract file information if it's in the format "name (X/Y)"
-                    parts = text2.split(" (")
-                    count_part = parts[1].split(")")[0]
-                    if "/" in count_part:
-                        current, total = count_part.split("/")
-                        self.completed_operations = int(current)
-                        self.total_operations = int(total)
-                        self.files_label.setText(f"Files: {current}/{total}")
-                except:
-                    # If we can't parse the file info, just use text2 as current operation
-                    pass
+            # (legacy format, only used if not passed explicitly)
+            if completed is None and " (" in text2 and ")" in text2:
+                # Extract file information if it's in the format "name (X/Y)"
+                parts = text2.split(" (")
+                count_part = parts[1].split(")")[0]
+
+                # If we can't parse the file info, just use text2 as current operation
+                current_s, _, total_s = count_part.partition("/")
+                if current_s.isdecimal() and total_s.isdecimal():
+                    self.completed_operations = int(current_s)
+                    self.total_operations = int(total_s)
+                    self.files_label.setText(f"Files: {current_s:>6}/{total_s:<6}")
                     
             # Update current operation label
             self.current_op_label.setText(text2)
             
             # Add operation to the list if it contains useful information
-            if len(text2) > 5 and text2 not in self.last_operations:
+            if len(text2) > 5 and text2 not in self._ops_set:
                 self.add_operation_to_list(text2)
                 
         # If there's a third text item, add it to the operation list
         if text3 is not None and len(text3) > 5:
             # Only add if it's descriptive enough and not already in the list
-            if text3 not in self.last_operations:
+            if text3 not in self._ops_set:
                 self.add_operation_to_list(text3)
-                
-        # Center the dialog if needed
-        utils.center(self, self.app.root)
 
     def exec(self):
         """
@@ -357,12 +480,12 @@ class LoadingDialog(qtw.QDialog):
         # Start the dialog thread
         self.dialog_thread.start()
         
-        # Set the start time
-        self.starttime = time.time()
-        
         # Execute the dialog (blocks until closed)
         super().exec()
         
+        # Wait for the thread to store a possible exception
+        self.dialog_thread.join()
+
         # Propagate any exceptions from the thread
         if self.dialog_thread.exception is not None:
             raise self.dialog_thread.exception
@@ -388,4 +511,3 @@ class LoadingDialogThread(threading.Thread):
             super().run()
         except Exception as ex:
             self.exception = ex
-            self.dialog.stop_signal.emit()